@@ -100,10 +100,14 @@ class FileDescriptor(log.Logger, styles.Ephemeral, object):
         indicates no write was done, and a result of None indicates that a
         write was done.
         """
-        if len(self.dataBuffer) - self.offset < self.SEND_LIMIT:
+        if (self._tempDataBuffer and
+            len(self.dataBuffer) - self.offset < self.SEND_LIMIT):
             # If there is currently less than SEND_LIMIT bytes left to send
-            # in the string, extend it with the array data.
-            self.dataBuffer = buffer(self.dataBuffer, self.offset) + "".join(self._tempDataBuffer)
+            # in the string, extend it with the array data.  Join the unsent
+            # tail and the new chunks in one pass, so each queued chunk is
+            # copied only once.
+            self._tempDataBuffer.insert(0, self.dataBuffer[self.offset:])
+            self.dataBuffer = "".join(self._tempDataBuffer)
             self.offset = 0
             self._tempDataBuffer = []
             self._tempDataLen = 0
@@ -183,8 +187,10 @@ class FileDescriptor(log.Logger, styles.Ephemeral, object):
         if data:
             self._tempDataBuffer.append(data)
             self._tempDataLen += len(data)
-            # If we are responsible for pausing our producer,
-            if self.producer is not None and self.streamingProducer:
+            # If we are responsible for pausing our producer, it is not
+            # paused already,
+            if (self.producer is not None and self.streamingProducer and
+                not self.producerPaused):
                 # and our buffer is full,
                 if len(self.dataBuffer) + self._tempDataLen > self.bufferSize:
                     # pause it.
@@ -210,10 +216,11 @@ class FileDescriptor(log.Logger, styles.Ephemeral, object):
         if not self.connected or not iovec or self._writeDisconnected:
             return
         self._tempDataBuffer.extend(iovec)
-        for i in iovec:
-            self._tempDataLen += len(i)
-        # If we are responsible for pausing our producer,
-        if self.producer is not None and self.streamingProducer:
+        self._tempDataLen += sum(map(len, iovec))
+        # If we are responsible for pausing our producer, it is not paused
+        # already,
+        if (self.producer is not None and self.streamingProducer and
+            not self.producerPaused):
             # and our buffer is full,
             if len(self.dataBuffer) + self._tempDataLen > self.bufferSize:
                 # pause it.
@@ -309,6 +316,7 @@ class FileDescriptor(log.Logger, styles.Ephemeral, object):
         else:
             self.producer = producer
             self.streamingProducer = streaming
+            self.producerPaused = 0
             if not streaming:
                 producer.resumeProducing()
 
@@ -12,7 +12,8 @@ from zope.interface import implements, classImplements
 import sys
 import warnings
 import operator
-from heapq import heappush, heappop, heapify
+import itertools
+from heapq import heappush, heappop, heapify, nsmallest
 
 import traceback
 
@@ -40,6 +41,10 @@ class DelayedCall(styles.Ephemeral):
     debug = False
     _str = None
 
+    # The reactor's heap entry which currently schedules this call.  Entries
+    # left behind by rescheduling are recognized by not being this one.
+    _heapEntry = None
+
     def __init__(self, time, func, args, kw, cancel, reset,
                  seconds=runtimeSeconds):
         """
@@ -258,6 +263,102 @@ class ThreadedResolver(object):
 
 
 
+class CachingResolver(object):
+    """
+    L{CachingResolver} wraps another L{IResolverSimple} provider and remembers
+    the addresses it returns for a while, so that repeated lookups of the same
+    name do not each go to the wrapped resolver.
+
+    L{IResolverSimple} gives no access to the TTL of the records involved, so
+    every successful lookup is kept for the same fixed number of seconds.
+    Failed lookups are never cached.
+
+    @ivar resolver: The L{IResolverSimple} provider which performs the lookups
+        which are not answered from the cache.
+    @ivar reactor: The L{IReactorTime} provider used to decide when cached
+        addresses expire.
+    @ivar ttl: The number of seconds for which an address is cached.
+    @ivar size: The largest number of names which will be cached at once.
+    @ivar _cache: A C{dict} mapping names to two-tuples of an address and the
+        time at which it expires.  It may be shared with other
+        L{CachingResolver}s, possibly used from other threads, so it is only
+        changed with single dictionary operations and entries may disappear
+        between any two of them.
+    """
+    implements(IResolverSimple)
+
+    def __init__(self, resolver, reactor=None, ttl=60, size=1000, cache=None):
+        """
+        @param cache: If not C{None}, a C{dict} to keep cached addresses in.
+            Resolvers given the same C{dict} share their cache, so a process
+            running several reactors keeps one copy of each address and a
+            name resolved through any of them is cached for all.  Those
+            reactors should measure time the same way.  If C{None}, the
+            cache is private to this resolver.
+        """
+        if reactor is None:
+            from twisted.internet import reactor
+        if cache is None:
+            cache = {}
+        self.resolver = resolver
+        self.reactor = reactor
+        self.ttl = ttl
+        self.size = size
+        self._cache = cache
+
+
+    def _evict(self, now):
+        """
+        Make room in the cache for new names.
+
+        Expired entries are dropped first.  If that does not free at least a
+        tenth of C{size}, the live entries which expire soonest are dropped
+        too, so the scan over the cache is only paid once for that many new
+        names.
+        """
+        cache = self._cache
+        live = []
+        for key, (ignored, expires) in cache.items():
+            if expires <= now:
+                cache.pop(key, None)
+            else:
+                live.append((expires, key))
+        excess = len(live) - (self.size - max(1, self.size // 10))
+        if excess > 0:
+            for expires, key in nsmallest(excess, live):
+                cache.pop(key, None)
+
+
+    def _cacheResult(self, address, name):
+        cache = self._cache
+        now = self.reactor.seconds()
+        if name not in cache and len(cache) >= self.size:
+            self._evict(now)
+        cache[name] = (address, now + self.ttl)
+        return address
+
+
+    def getHostByName(self, name, timeout = (1, 3, 11, 45)):
+        """
+        See L{twisted.internet.interfaces.IResolverSimple.getHostByName}.
+
+        If C{name} was resolved less than C{ttl} seconds ago, the L{Deferred}
+        returned has already been called back with the remembered address.
+        """
+        try:
+            address, expires = self._cache[name]
+        except KeyError:
+            pass
+        else:
+            if expires > self.reactor.seconds():
+                return defer.succeed(address)
+            self._cache.pop(name, None)
+        d = self.resolver.getHostByName(name, timeout)
+        d.addCallback(self._cacheResult, name)
+        return d
+
+
+
 class BlockingResolver:
     implements(IResolverSimple)
 
@@ -452,6 +553,7 @@ class ReactorBase(object):
         self._pendingTimedCalls = []
         self._newTimedCalls = []
         self._cancellations = 0
+        self._timedCallSequence = itertools.count()
         self.running = False
         self._started = False
         self._justStopped = False
@@ -681,25 +783,31 @@ class ReactorBase(object):
         self._newTimedCalls.append(tple)
         return tple
 
-    def _moveCallLaterSooner(self, tple):
-        # Linear time find: slow.
-        heap = self._pendingTimedCalls
-        try:
-            pos = heap.index(tple)
+    def _isLiveEntry(self, entry):
+        """
+        Return whether C{entry} in the heap of pending timed calls still
+        schedules its call, rather than being left behind by a cancellation
+        or a reschedule.
+        """
+        call = entry[2]
+        return call._heapEntry is entry and not call.cancelled
 
-            # Move elt up the heap until it rests at the right place.
-            elt = heap[pos]
-            while pos != 0:
-                parent = (pos-1) // 2
-                if heap[parent] <= elt:
-                    break
-                # move parent down
-                heap[pos] = heap[parent]
-                pos = parent
-            heap[pos] = elt
-        except ValueError:
-            # element was not found in heap - oh well...
-            pass
+    def _pushDelayedCall(self, call):
+        """
+        Schedule C{call} in the heap of pending timed calls at its current
+        time, replacing any entry which scheduled it before.
+        """
+        entry = (call.time, self._timedCallSequence.next(), call)
+        call._heapEntry = entry
+        heappush(self._pendingTimedCalls, entry)
+
+    def _moveCallLaterSooner(self, tple):
+        # Calls still in _newTimedCalls will be pushed at their new time.
+        # Otherwise push a new entry and leave the old one to be discarded
+        # when it is popped, like a cancelled call.
+        if tple._heapEntry is not None:
+            self._cancellations += 1
+            self._pushDelayedCall(tple)
 
     def _cancelCallLater(self, tple):
         self._cancellations+=1
@@ -717,7 +825,9 @@ class ReactorBase(object):
         They are returned in no particular order.
         This method is not efficient -- it is really only meant for
         test cases."""
-        return [x for x in (self._pendingTimedCalls + self._newTimedCalls) if not x.cancelled]
+        return ([e[2] for e in self._pendingTimedCalls
+                 if self._isLiveEntry(e)] +
+                [x for x in self._newTimedCalls if not x.cancelled])
 
     def _insertNewDelayedCalls(self):
         for call in self._newTimedCalls:
@@ -725,7 +835,7 @@ class ReactorBase(object):
                 self._cancellations-=1
             else:
                 call.activate_delay()
-                heappush(self._pendingTimedCalls, call)
+                self._pushDelayedCall(call)
         self._newTimedCalls = []
 
     def timeout(self):
@@ -735,7 +845,7 @@ class ReactorBase(object):
         if not self._pendingTimedCalls:
             return None
 
-        return max(0, self._pendingTimedCalls[0].time - self.seconds())
+        return max(0, self._pendingTimedCalls[0][0] - self.seconds())
 
 
     def runUntilCurrent(self):
@@ -763,15 +873,16 @@ class ReactorBase(object):
         self._insertNewDelayedCalls()
 
         now = self.seconds()
-        while self._pendingTimedCalls and (self._pendingTimedCalls[0].time <= now):
-            call = heappop(self._pendingTimedCalls)
-            if call.cancelled:
+        while self._pendingTimedCalls and (self._pendingTimedCalls[0][0] <= now):
+            entry = heappop(self._pendingTimedCalls)
+            call = entry[2]
+            if call.cancelled or call._heapEntry is not entry:
                 self._cancellations-=1
                 continue
 
             if call.delayed_time > 0:
                 call.activate_delay()
-                heappush(self._pendingTimedCalls, call)
+                self._pushDelayedCall(call)
                 continue
 
             try:
@@ -792,8 +903,8 @@ class ReactorBase(object):
         if (self._cancellations > 50 and
              self._cancellations > len(self._pendingTimedCalls) >> 1):
             self._cancellations = 0
-            self._pendingTimedCalls = [x for x in self._pendingTimedCalls
-                                       if not x.cancelled]
+            self._pendingTimedCalls = filter(
+                self._isLiveEntry, self._pendingTimedCalls)
             heapify(self._pendingTimedCalls)
 
         if self._justStopped:
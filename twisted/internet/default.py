@@ -1,21 +1,65 @@
-# -*- test-case-name: twisted.test.test_internet -*-
-# $Id: default.py,v 1.90 2004/01/06 22:35:22 warner Exp $
-#
-# Copyright (c) 2001-2004 Twisted Matrix Laboratories.
+# -*- test-case-name: twisted.internet.test.test_default -*-
+# Copyright (c) 2001-2009 Twisted Matrix Laboratories.
 # See LICENSE for details.
 
-
 """
-Deprecated module that used to contain SelectReactor and PosixReactorBase
+The most suitable default reactor for the current platform.
 
-Maintainer: Itamar Shtull-Trauring
+On Linux this is the epoll reactor, falling back to the select reactor when
+epoll is unavailable; everywhere else it is the select reactor.  Depending on
+a specific application's needs, some other reactor may in fact be better.
 """
 
-import warnings
-warnings.warn("twisted.internet.default is deprecated. Use posixbase or selectreactor instead.", category=DeprecationWarning)
+import sys
+
+# Backwards compatibility: this module used to contain these.
+from twisted.internet.posixbase import PosixReactorBase
+from twisted.internet.selectreactor import SelectReactor
+
+
+def _installEPollOrSelect():
+    """
+    Install an epoll reactor, or a select reactor if epoll cannot be used.
+
+    The epoll module may import without epoll actually working, for example
+    on a kernel built without it or inside a sandbox which forbids the
+    system call.  In that case creating the reactor raises and the select
+    reactor is installed instead.
+    """
+    from twisted.internet import epollreactor, selectreactor
+    from twisted.internet.main import installReactor
+    try:
+        reactor = epollreactor.EPollReactor()
+    except (IOError, OSError):
+        reactor = selectreactor.SelectReactor()
+    installReactor(reactor)
+
+
+
+def _getInstallFunction(platform):
+    """
+    Return a function to install the reactor most suited for the given
+    platform.
+
+    @param platform: The platform for which to select a reactor, as given by
+        C{sys.platform}.
+    @type platform: C{str}
+
+    @return: A zero-argument callable which will install the selected
+        reactor.
+    """
+    if platform.startswith('linux'):
+        try:
+            from twisted.internet import epollreactor
+        except ImportError:
+            pass
+        else:
+            epollreactor  # imported only to check availability
+            return _installEPollOrSelect
+    from twisted.internet.selectreactor import install
+    return install
+
 
-# Backwards compat
-from posixbase import PosixReactorBase
-from selectreactor import SelectReactor, install
+install = _getInstallFunction(sys.platform)
 
 __all__ = ["install", "PosixReactorBase", "SelectReactor"]
@@ -107,8 +107,16 @@ def maybeDeferred(f, *args, **kw):
         return result
     elif isinstance(result, failure.Failure):
         return fail(result)
-    else:
+    elif Deferred.debug:
         return succeed(result)
+    else:
+        # The result is known to be neither a Deferred nor a Failure, and a
+        # new Deferred has no callbacks to run, so it can be put directly
+        # into the state callback() would leave it in.
+        d = Deferred()
+        d.called = True
+        d.result = result
+        return d
 
 def timeout(deferred):
     deferred.errback(failure.Failure(TimeoutError("Callback timed out")))
@@ -116,6 +124,14 @@ def timeout(deferred):
 def passthru(arg):
     return arg
 
+# Keyword arguments for callbacks which were added without any.  This is
+# shared by all such callbacks and must never be mutated.
+_NO_KEYWORDS = {}
+
+# The half of a callback pair which passes the result through unchanged.
+# Callback pairs added without extra arguments all share this one tuple.
+_PASSTHRU_NOARGS = (passthru, (), _NO_KEYWORDS)
+
 def setDebugging(on):
     """Enable or disable Deferred debugging.
 
@@ -147,6 +163,11 @@ class Deferred:
     called = 0
     paused = 0
     timeoutCall = None
+
+    # Shared, immutable placeholder for the callback list.  Most Deferreds
+    # created by succeed() and fail() never have a callback added to them, so
+    # the real list is only allocated by the first call to addCallbacks.
+    callbacks = ()
     _debugInfo = None
 
     # Are we currently running a user-installed callback?  Meant to prevent
@@ -159,7 +180,6 @@ class Deferred:
     debug = False
 
     def __init__(self):
-        self.callbacks = []
         if self.debug:
             self._debugInfo = DebugInfo()
             self._debugInfo.creator = traceback.format_stack()[:-1]
@@ -173,8 +193,21 @@ class Deferred:
         """
         assert callable(callback)
         assert errback == None or callable(errback)
-        cbs = ((callback, callbackArgs, callbackKeywords),
-               (errback or (passthru), errbackArgs, errbackKeywords))
+        # Missing arguments are filled in here, once, so that _runCallbacks
+        # can pass them on without checking them.
+        cbs = ((callback, callbackArgs or (),
+                callbackKeywords or _NO_KEYWORDS),
+               (errback or (passthru), errbackArgs or (),
+                errbackKeywords or _NO_KEYWORDS))
+        return self._addCallbackPair(cbs)
+
+    def _addCallbackPair(self, cbs):
+        """
+        Append an already constructed (callback, errback) pair to the
+        callback chain, running it immediately if this Deferred has fired.
+        """
+        if type(self.callbacks) is tuple:
+            self.callbacks = []
         self.callbacks.append(cbs)
 
         if self.called:
@@ -186,17 +219,25 @@ class Deferred:
 
         See L{addCallbacks}.
         """
-        return self.addCallbacks(callback, callbackArgs=args,
-                                 callbackKeywords=kw)
+        if args or kw:
+            return self.addCallbacks(callback, callbackArgs=args,
+                                     callbackKeywords=kw)
+        assert callable(callback)
+        return self._addCallbackPair(
+            ((callback, (), _NO_KEYWORDS), _PASSTHRU_NOARGS))
 
     def addErrback(self, errback, *args, **kw):
         """Convenience method for adding just an errback.
 
         See L{addCallbacks}.
         """
-        return self.addCallbacks(passthru, errback,
-                                 errbackArgs=args,
-                                 errbackKeywords=kw)
+        if args or kw:
+            return self.addCallbacks(passthru, errback,
+                                     errbackArgs=args,
+                                     errbackKeywords=kw)
+        assert callable(errback)
+        return self._addCallbackPair(
+            (_PASSTHRU_NOARGS, (errback, (), _NO_KEYWORDS)))
 
     def addBoth(self, callback, *args, **kw):
         """Convenience method for adding a single callable as both a callback
@@ -204,9 +245,13 @@ class Deferred:
 
         See L{addCallbacks}.
         """
-        return self.addCallbacks(callback, callback,
-                                 callbackArgs=args, errbackArgs=args,
-                                 callbackKeywords=kw, errbackKeywords=kw)
+        if args or kw:
+            return self.addCallbacks(callback, callback,
+                                     callbackArgs=args, errbackArgs=args,
+                                     callbackKeywords=kw, errbackKeywords=kw)
+        assert callable(callback)
+        cb = (callback, (), _NO_KEYWORDS)
+        return self._addCallbackPair((cb, cb))
 
     def chainDeferred(self, d):
         """Chain another Deferred to this Deferred.
@@ -223,7 +268,8 @@ class Deferred:
         However, the converse is B{not} true; if d2 is fired d1 will not be
         affected.
         """
-        return self.addCallbacks(d.callback, d.errback)
+        return self._addCallbackPair(((d.callback, (), _NO_KEYWORDS),
+                                      (d.errback, (), _NO_KEYWORDS)))
 
     def callback(self, result):
         """Run all success callbacks that have been added to this Deferred.
@@ -297,52 +343,69 @@ class Deferred:
             self._debugInfo.invoker = traceback.format_stack()[:-2]
         self.called = True
         self.result = result
-        if self.timeoutCall:
-            try:
+        if self.timeoutCall is not None:
+            # The call is no longer active if this result is being delivered
+            # by the timeout itself.
+            if self.timeoutCall.active():
                 self.timeoutCall.cancel()
-            except:
-                pass
-
             del self.timeoutCall
         self._runCallbacks()
 
-    def _runCallbacks(self):
+    def _runCallbacks(self, _Failure=failure.Failure):
         if self._runningCallbacks:
             # Don't recursively run callbacks
             return
         if not self.paused:
-            while self.callbacks:
-                item = self.callbacks.pop(0)
-                callback, args, kw = item[
-                    isinstance(self.result, failure.Failure)]
-                args = args or ()
-                kw = kw or {}
+            # The current result and the callback list are kept in locals for
+            # the duration of the loop.  The result is only stored back on
+            # self when the loop finishes or when processing is suspended
+            # waiting for another Deferred, and callbacks which have been run
+            # are removed from the list in one go at the same points rather
+            # than one at a time from its front.
+            result = self.result
+            callbacks = self.callbacks
+            index = 0
+            while index < len(callbacks):
+                item = callbacks[index]
+                index += 1
+                if isinstance(result, _Failure):
+                    callback, args, kw = item[1]
+                else:
+                    callback, args, kw = item[0]
                 try:
                     self._runningCallbacks = True
                     try:
-                        self.result = callback(self.result, *args, **kw)
+                        result = callback(result, *args, **kw)
                     finally:
                         self._runningCallbacks = False
-                    if isinstance(self.result, Deferred):
+                    if isinstance(result, Deferred):
                         # note: this will cause _runCallbacks to be called
-                        # recursively if self.result already has a result.
+                        # recursively if result already has a result.
                         # This shouldn't cause any problems, since there is no
                         # relevant state in this stack frame at this point.
                         # The recursive call will continue to process
                         # self.callbacks until it is empty, then return here,
                         # where there is no more work to be done, so this call
                         # will return as well.
+                        del callbacks[:index]
+                        index = 0
+                        self.result = result
                         self.pause()
-                        self.result.addBoth(self._continue)
+                        result.addBoth(self._continue)
                         break
                 except:
-                    self.result = failure.Failure()
+                    result = _Failure()
+            else:
+                if index:
+                    del callbacks[:index]
+                self.result = result
 
-        if isinstance(self.result, failure.Failure):
-            self.result.cleanFailure()
+        result = self.result
+        if isinstance(result, _Failure):
+            result.cleanFailure()
             if self._debugInfo is None:
                 self._debugInfo = DebugInfo()
-            self._debugInfo.failResult = self.result
+            self._debugInfo.failResult = result
         else:
             if self._debugInfo is not None:
                 self._debugInfo.failResult = None
@@ -496,10 +559,7 @@ class DeferredList(Deferred):
                             consumed by this DeferredList.  This is useful to
                             prevent spurious warnings being logged.
         """
-        self.resultList = [None] * len(deferredList)
         Deferred.__init__(self)
-        if len(deferredList) == 0 and not fireOnOneCallback:
-            self.callback(self.resultList)
 
         # These flags need to be set *before* attaching callbacks to the
         # deferreds, because the callbacks use these flags, and will run
@@ -507,13 +567,34 @@ class DeferredList(Deferred):
         self.fireOnOneCallback = fireOnOneCallback
         self.fireOnOneErrback = fireOnOneErrback
         self.consumeErrors = consumeErrors
+
+        if not fireOnOneCallback:
+            for deferred in deferredList:
+                if not _hasSuccessResult(deferred):
+                    break
+            else:
+                # Every Deferred (if any) already has its final, successful
+                # result: build the result list in one go and fire now.
+                self.resultList = [(SUCCESS, deferred.result)
+                                   for deferred in deferredList]
+                self.finishedCount = len(self.resultList)
+                self.callback(self.resultList)
+                return
+
+        self.resultList = [None] * len(deferredList)
         self.finishedCount = 0
 
         index = 0
         for deferred in deferredList:
-            deferred.addCallbacks(self._cbDeferred, self._cbDeferred,
-                                  callbackArgs=(index,SUCCESS),
-                                  errbackArgs=(index,FAILURE))
+            if _hasSuccessResult(deferred):
+                # Record the result directly instead of going through the
+                # callback chain; the result is passed through unchanged
+                # either way.
+                self._cbDeferred(deferred.result, index, SUCCESS)
+            else:
+                deferred.addCallbacks(self._cbDeferred, self._cbDeferred,
+                                      callbackArgs=(index,SUCCESS),
+                                      errbackArgs=(index,FAILURE))
             index = index + 1
 
     def _cbDeferred(self, result, index, succeeded):
@@ -536,6 +617,18 @@ class DeferredList(Deferred):
         return result
 
 
+def _hasSuccessResult(deferred):
+    """
+    Determine whether a L{Deferred} already has a successful result which
+    nothing queued on it can change.
+
+    @rtype: C{bool}
+    """
+    return (deferred.called and not deferred.paused
+            and not deferred._runningCallbacks
+            and not isinstance(deferred.result, failure.Failure))
+
+
 def _parseDListResult(l, fireOnOneErrback=0):
     if __debug__:
         for success, value in l:
@@ -757,6 +850,15 @@ def _inlineCallbacks(result, g, deferred):
             return deferred
 
         if isinstance(result, Deferred):
+            if _hasSuccessResult(result):
+                # The result is already there: take it without allocating a
+                # callback, leaving None behind just as gotResult below
+                # would.
+                value = result.result
+                result.result = None
+                result = value
+                continue
+
             # a deferred was yielded, get the result.
             def gotResult(r):
                 if waiting[0]:
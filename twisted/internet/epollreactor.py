@@ -17,13 +17,62 @@ from zope.interface import implements
 
 from twisted.internet.interfaces import IReactorFDSet
 
-from twisted.python import _epoll
 from twisted.python import log
 from twisted.internet import posixbase, error
 from twisted.internet.main import CONNECTION_LOST
 
+try:
+    # Python 2.6 and newer include an epoll wrapper in the select module.
+    # Prefer it to Twisted's own extension module, which is often not built.
+    import select
+    select.epoll
+except AttributeError:
+    from twisted.python import _epoll
+else:
+    _epoll = None
 
-_POLL_DISCONNECTED = (_epoll.HUP | _epoll.ERR)
+
+if _epoll is None:
+    class _SelectEPoll(object):
+        """
+        Present a L{select.epoll} object with the same interface as
+        C{twisted.python._epoll.epoll}, which L{EPollReactor} was written
+        against.
+        """
+        def __init__(self, size):
+            self._poller = select.epoll(size)
+            self._operations = {
+                _CTL_ADD: self._poller.register,
+                _CTL_MOD: self._poller.modify}
+
+
+        def _control(self, op, fd, events):
+            if op == _CTL_DEL:
+                self._poller.unregister(fd)
+            else:
+                self._operations[op](fd, events)
+
+
+        def close(self):
+            self._poller.close()
+
+
+        def wait(self, maxevents, timeout):
+            # select.epoll.poll rejects a maxevents of 0; -1 lets it choose.
+            return self._poller.poll(timeout / 1000.0, maxevents or -1)
+
+
+    _newPoller = _SelectEPoll
+    _IN, _OUT = select.EPOLLIN, select.EPOLLOUT
+    _HUP, _ERR = select.EPOLLHUP, select.EPOLLERR
+    _CTL_ADD, _CTL_MOD, _CTL_DEL = 1, 3, 2
+else:
+    _newPoller = _epoll.epoll
+    _IN, _OUT, _HUP, _ERR = _epoll.IN, _epoll.OUT, _epoll.HUP, _epoll.ERR
+    _CTL_ADD, _CTL_MOD, _CTL_DEL = _epoll.CTL_ADD, _epoll.CTL_MOD, _epoll.CTL_DEL
+
+
+_POLL_DISCONNECTED = (_HUP | _ERR)
 
 class EPollReactor(posixbase.PosixReactorBase):
     """
@@ -59,7 +108,7 @@ class EPollReactor(posixbase.PosixReactorBase):
         """
         # Create the poller we're going to use.  The 1024 here is just a hint
         # to the kernel, it is not a hard maximum.
-        self._poller = _epoll.epoll(1024)
+        self._poller = _newPoller(1024)
         self._reads = {}
         self._writes = {}
         self._selectables = {}
@@ -75,11 +124,11 @@ class EPollReactor(posixbase.PosixReactorBase):
         """
         fd = xer.fileno()
         if fd not in primary:
-            cmd = _epoll.CTL_ADD
+            cmd = _CTL_ADD
             flags = event
             if fd in other:
                 flags |= antievent
-                cmd = _epoll.CTL_MOD
+                cmd = _CTL_MOD
             primary[fd] = 1
             selectables[fd] = xer
             # epoll_ctl can raise all kinds of IOErrors, and every one
@@ -94,14 +143,14 @@ class EPollReactor(posixbase.PosixReactorBase):
         """
         Add a FileDescriptor for notification of data available to read.
         """
-        self._add(reader, self._reads, self._writes, self._selectables, _epoll.IN, _epoll.OUT)
+        self._add(reader, self._reads, self._writes, self._selectables, _IN, _OUT)
 
 
     def addWriter(self, writer):
         """
         Add a FileDescriptor for notification of data available to write.
         """
-        self._add(writer, self._writes, self._reads, self._selectables, _epoll.OUT, _epoll.IN)
+        self._add(writer, self._writes, self._reads, self._selectables, _OUT, _IN)
 
 
     def _remove(self, xer, primary, other, selectables, event, antievent):
@@ -119,11 +168,11 @@ class EPollReactor(posixbase.PosixReactorBase):
             else:
                 return
         if fd in primary:
-            cmd = _epoll.CTL_DEL
+            cmd = _CTL_DEL
             flags = event
             if fd in other:
                 flags = antievent
-                cmd = _epoll.CTL_MOD
+                cmd = _CTL_MOD
             else:
                 del selectables[fd]
             del primary[fd]
@@ -135,14 +184,14 @@ class EPollReactor(posixbase.PosixReactorBase):
         """
         Remove a Selectable for notification of data available to read.
         """
-        self._remove(reader, self._reads, self._writes, self._selectables, _epoll.IN, _epoll.OUT)
+        self._remove(reader, self._reads, self._writes, self._selectables, _IN, _OUT)
 
 
     def removeWriter(self, writer):
         """
         Remove a Selectable for notification of data available to write.
         """
-        self._remove(writer, self._writes, self._reads, self._selectables, _epoll.OUT, _epoll.IN)
+        self._remove(writer, self._writes, self._reads, self._selectables, _OUT, _IN)
 
     def removeAll(self):
         """
@@ -202,14 +251,14 @@ class EPollReactor(posixbase.PosixReactorBase):
         """
         why = None
         inRead = False
-        if event & _POLL_DISCONNECTED and not (event & _epoll.IN):
+        if event & _POLL_DISCONNECTED and not (event & _IN):
             why = CONNECTION_LOST
         else:
             try:
-                if event & _epoll.IN:
+                if event & _IN:
                     why = selectable.doRead()
                     inRead = True
-                if not why and event & _epoll.OUT:
+                if not why and event & _OUT:
                     why = selectable.doWrite()
                     inRead = False
                 if selectable.fileno() != fd:
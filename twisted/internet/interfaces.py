@@ -221,7 +221,8 @@ class IReactorArbitrary(Interface):
 
 class IReactorTCP(Interface):
 
-    def listenTCP(port, factory, backlog=50, interface=''):
+    def listenTCP(port, factory, backlog=50, interface='',
+                  listenMultiple=False):
         """
         Connects a given protocol factory to the given numeric TCP/IP port.
 
@@ -233,6 +234,14 @@ class IReactorTCP(Interface):
 
         @param interface: the hostname to bind to, defaults to '' (all)
 
+        @param listenMultiple: if true, allow several sockets (typically one
+            in each of a group of processes) to listen on the same address
+            at once, with the kernel spreading incoming connections between
+            them.  This uses C{SO_REUSEPORT}, so it only has an effect in
+            reactors based on L{twisted.internet.posixbase.PosixReactorBase}
+            running on platforms which provide that option; elsewhere the
+            port listens as if it were false.
+
         @return: an object that provides L{IListeningPort}.
 
         @raise CannotListenError: as defined here
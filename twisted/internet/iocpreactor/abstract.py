@@ -246,11 +246,13 @@ class FileHandle(log.Logger, styles.Ephemeral, object):
     def doWrite(self):
         numWrites = 0
         while 1:
-            if len(self.dataBuffer) - self.offset < self.SEND_LIMIT:
+            if (self._tempDataBuffer and
+                len(self.dataBuffer) - self.offset < self.SEND_LIMIT):
                 # If there is currently less than SEND_LIMIT bytes left to send
-                # in the string, extend it with the array data.
-                self.dataBuffer = (buffer(self.dataBuffer, self.offset) +
-                                   "".join(self._tempDataBuffer))
+                # in the string, extend it with the array data, copying each
+                # queued chunk only once.
+                self._tempDataBuffer.insert(0, self.dataBuffer[self.offset:])
+                self.dataBuffer = "".join(self._tempDataBuffer)
                 self.offset = 0
                 self._tempDataBuffer = []
                 self._tempDataLen = 0
@@ -301,8 +303,7 @@ class FileHandle(log.Logger, styles.Ephemeral, object):
         if not self.connected or not iovec or self._writeDisconnected:
             return
         self._tempDataBuffer.extend(iovec)
-        for i in iovec:
-            self._tempDataLen += len(i)
+        self._tempDataLen += sum(map(len, iovec))
         if self.producer is not None:
             if len(self.dataBuffer) + self._tempDataLen > self.writeBufferSize:
                 self.producerPaused = True
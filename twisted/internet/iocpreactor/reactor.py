@@ -144,9 +144,13 @@ class IOCPReactor(base._SignalReactorMixin, base.ReactorBase):
         return skt
 
 
-    def listenTCP(self, port, factory, backlog=50, interface=''):
+    def listenTCP(self, port, factory, backlog=50, interface='',
+                  listenMultiple=False):
         """
         @see: twisted.internet.interfaces.IReactorTCP.listenTCP
+
+        Windows has no C{SO_REUSEPORT}, so C{listenMultiple} is accepted for
+        compatibility and has no effect.
         """
         p = tcp.Port(port, factory, backlog, interface, self)
         p.startListening()
@@ -460,6 +460,11 @@ class Port(styles.Ephemeral, _SocketCloser):
 
     maxAccepts = 100
 
+    # Number of AcceptEx operations kept outstanding on the listening socket,
+    # so that a burst of incoming connections does not wait for each
+    # completion to be processed before the next accept is posted.
+    pendingAccepts = 8
+
     # Actual port number being listened on, only set to a non-None
     # value when we are actually listening.
     _realPortNumber = None
@@ -508,7 +513,10 @@ class Port(styles.Ephemeral, _SocketCloser):
         self.reactor.addActiveHandle(self)
         self.socket = skt
         self.getFileHandle = self.socket.fileno
-        self.doAccept()
+        for i in xrange(self.pendingAccepts):
+            if self.disconnecting or self.disconnected:
+                break
+            self.doAccept()
 
 
     def loseConnection(self, connDone=failure.Failure(main.CONNECTION_DONE)):
@@ -580,7 +588,7 @@ class Port(styles.Ephemeral, _SocketCloser):
     def cbAccept(self, rc, bytes, evt):
         self.handleAccept(rc, evt)
         if not (self.disconnecting or self.disconnected):
-            self.doAccept()
+            self.doAccept(evt.buff)
 
 
     def handleAccept(self, rc, evt):
@@ -615,13 +623,23 @@ class Port(styles.Ephemeral, _SocketCloser):
             return True
 
 
-    def doAccept(self):
+    def doAccept(self, buff=None):
+        """
+        Post AcceptEx operations until one is left pending.
+
+        @param buff: an address buffer from a completed accept to reuse, or
+            C{None} to allocate a new one.  The addresses in it have already
+            been read by L{handleAccept}, and an operation that completes
+            immediately is also handled before the next one is posted, so
+            one buffer serves every accept issued by this call.
+        """
+        if buff is None:
+            # see AcceptEx documentation
+            buff = _iocp.AllocateReadBuffer(2 * (self.addrLen + 16))
         numAccepts = 0
         while 1:
             evt = _iocp.Event(self.cbAccept, self)
-
-            # see AcceptEx documentation
-            evt.buff = buff = _iocp.AllocateReadBuffer(2 * (self.addrLen + 16))
+            evt.buff = buff
 
             evt.newskt = newskt = self.reactor.createSocket(self.addressFamily,
                                                             self.socketType)
@@ -68,19 +68,20 @@ class PollReactor(posixbase.PosixReactorBase):
 
     def _updateRegistration(self, fd):
         """Register/unregister an fd with the poller."""
-        try:
-            self._poller.unregister(fd)
-        except KeyError:
-            pass
-
         mask = 0
         if fd in self._reads:
             mask = mask | POLLIN
         if fd in self._writes:
             mask = mask | POLLOUT
         if mask != 0:
+            # Registering an fd which is already registered replaces its
+            # event mask, so there is no need to unregister it first.
             self._poller.register(fd, mask)
         else:
+            try:
+                self._poller.unregister(fd)
+            except KeyError:
+                pass
             if fd in self._selectables:
                 del self._selectables[fd]
 
@@ -58,8 +58,13 @@ class _Win32Waker(log.Logger, styles.Ephemeral):
 
     I am a pair of connected sockets which can wake up the main loop
     from another thread.
+
+    @ivar _wakeUpPending: Whether a byte has been sent which the main loop
+        has not yet read.  Further calls to L{wakeUp} before then send
+        nothing.
     """
     disconnected = 0
+    _wakeUpPending = False
 
     def __init__(self, reactor):
         """Initialize.
@@ -80,12 +85,16 @@ class _Win32Waker(log.Logger, styles.Ephemeral):
         self.fileno = self.r.fileno
 
     def wakeUp(self):
-        """Send a byte to my connection.
+        """Send a byte to my connection, unless one is already pending.
         """
+        if self._wakeUpPending:
+            return
+        self._wakeUpPending = True
         try:
             util.untilConcludes(self.w.send, 'x')
         except socket.error, (err, msg):
             if err != errno.WSAEWOULDBLOCK:
+                self._wakeUpPending = False
                 raise
 
     def doRead(self):
@@ -95,6 +104,7 @@ class _Win32Waker(log.Logger, styles.Ephemeral):
             self.r.recv(8192)
         except socket.error:
             pass
+        self._wakeUpPending = False
 
     def connectionLost(self, reason):
         self.r.close()
@@ -105,8 +115,14 @@ class _UnixWaker(log.Logger, styles.Ephemeral):
     """This class provides a simple interface to wake up the event loop.
 
     This is used by threads or signals to wake up the event loop.
+
+    @ivar _wakeUpPending: Whether a byte has been written to the pipe which
+        the main loop has not yet read.  Further calls to L{wakeUp} before
+        then write nothing, so a burst of C{callFromThread} calls costs one
+        write and one read.
     """
     disconnected = 0
+    _wakeUpPending = False
 
     i = None
     o = None
@@ -126,17 +142,23 @@ class _UnixWaker(log.Logger, styles.Ephemeral):
         """Read some bytes from the pipe.
         """
         fdesc.readFromFD(self.fileno(), lambda data: None)
+        # Only clear the flag after reading.  A wakeUp which finds it still
+        # set has already queued its work, and that work will be run by the
+        # current iteration of the main loop.
+        self._wakeUpPending = False
 
     def wakeUp(self):
         """Write one byte to the pipe, and flush it.
         """
         # We don't use fdesc.writeToFD since we need to distinguish
         # between EINTR (try again) and EAGAIN (do nothing).
-        if self.o is not None:
+        if self.o is not None and not self._wakeUpPending:
+            self._wakeUpPending = True
             try:
                 util.untilConcludes(os.write, self.o, 'x')
             except OSError, e:
                 if e.errno != errno.EAGAIN:
+                    self._wakeUpPending = False
                     raise
 
     def connectionLost(self, reason):
@@ -348,10 +370,11 @@ class PosixReactorBase(_SignalReactorMixin, ReactorBase):
 
     # IReactorTCP
 
-    def listenTCP(self, port, factory, backlog=50, interface=''):
+    def listenTCP(self, port, factory, backlog=50, interface='',
+                  listenMultiple=False):
         """@see: twisted.internet.interfaces.IReactorTCP.listenTCP
         """
-        p = tcp.Port(port, factory, backlog, interface, self)
+        p = tcp.Port(port, factory, backlog, interface, self, listenMultiple)
         p.startListening()
         return p
 
@@ -448,6 +448,35 @@ class _BaseProcess(BaseProcess, object):
         return "<%s pid=%s status=%s>" % (self.__class__.__name__,
                                           self.pid, self.status)
 
+def _listOpenFDs():
+    """
+    Return an iterable of the file descriptors which may be open in this
+    process.
+
+    Where C{/proc/self/fd} is available only the descriptors actually open
+    are listed, so that a child about to C{exec} does not have to make one
+    C{close} call per possible descriptor.  Otherwise every descriptor up to
+    the process limit (capped at 1024) is returned.
+
+    The descriptor used to read the directory is included in the result; it
+    will already be closed by the time the caller tries to close it.
+    """
+    try:
+        return [int(fd) for fd in os.listdir("/proc/self/fd")]
+    except OSError:
+        pass
+    try:
+        import resource
+        maxfds = resource.getrlimit(resource.RLIMIT_NOFILE)[1] + 1
+        # OS-X reports 9223372036854775808. That's a lot of fds to close
+        if maxfds > 1024:
+            maxfds = 1024
+    except:
+        maxfds = 256
+    return xrange(maxfds)
+
+
+
 class Process(_BaseProcess):
     """
     An operating-system Process.
@@ -604,16 +633,7 @@ class Process(_BaseProcess):
             errfd.write("starting _setupChild\n")
 
         destList = fdmap.values()
-        try:
-            import resource
-            maxfds = resource.getrlimit(resource.RLIMIT_NOFILE)[1] + 1
-            # OS-X reports 9223372036854775808. That's a lot of fds to close
-            if maxfds > 1024:
-                maxfds = 1024
-        except:
-            maxfds = 256
-
-        for fd in xrange(maxfds):
+        for fd in _listOpenFDs():
             if fd in destList:
                 continue
             if debug and fd == errfd.fileno():
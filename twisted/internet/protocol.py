@@ -661,7 +661,10 @@ class FileWrapper:
         self.loseConnection()
 
     def writeSequence(self, iovec):
-        self.write("".join(iovec))
+        try:
+            self.file.writelines(iovec)
+        except:
+            self.handleException()
 
     def loseConnection(self):
         self.closed = 1
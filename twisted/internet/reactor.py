@@ -6,8 +6,9 @@ The reactor is the Twisted event loop within Twisted, the loop which drives
 applications using Twisted. The reactor provides APIs for networking,
 threading, dispatching events, and more.
 
-The default reactor is based on C{select(2)} and will be installed if this
-module is imported without another reactor being explicitly installed.
+The default reactor is installed if this module is imported without another
+reactor being explicitly installed.  On Linux it is based on C{epoll(4)} when
+that is available; everywhere else it is based on C{select(2)}.
 Regardless of which reactor is installed, importing this module is the correct
 way to get a reference to it.
 
@@ -34,5 +35,9 @@ this is not currently possible.
 
 import sys
 del sys.modules['twisted.internet.reactor']
-from twisted.internet import selectreactor
-selectreactor.install()
+# Deleting this module from sys.modules releases the module object, which
+# resets every global bound so far (sys included) to None.  Only names bound
+# after this point can be relied on, so the choice of reactor is made by
+# twisted.internet.default rather than here.
+from twisted.internet import default
+default.install()
@@ -372,11 +372,16 @@ class Connection(abstract.FileDescriptor, _SocketCloser):
 
     @ivar logstr: prefix used when logging events related to this connection.
     @type logstr: C{str}
+
+    @ivar _host: The address returned by C{getHost}, once it is known.  The
+        local address of a connected socket does not change, so
+        C{getsockname} need only be called once.
     """
 
     implements(interfaces.ITCPTransport, interfaces.ISystemHandle)
 
     TLS = 0
+    _host = None
 
     def __init__(self, skt, protocol, reactor=None):
         abstract.FileDescriptor.__init__(self, reactor=reactor)
@@ -708,7 +713,13 @@ class Client(BaseClient):
 
         This indicates the address from which I am connecting.
         """
-        return address.IPv4Address('TCP', *(self.socket.getsockname() + ('INET',)))
+        if self._host is not None:
+            return self._host
+        host = address.IPv4Address('TCP', *(self.socket.getsockname() + ('INET',)))
+        # The local address is only settled once the connection is made.
+        if self.connected:
+            self._host = host
+        return host
 
     def getPeer(self):
         """Returns an IPv4Address.
@@ -728,8 +739,14 @@ class Server(Connection):
 
     This is a serverside network connection transport; a socket which came from
     an accept() on a server.
+
+    @ivar _peer: The address returned by C{getPeer}, once it has been asked
+        for.  It is built from the address C{accept} returned, so no system
+        call is needed to find it.
     """
 
+    _peer = None
+
     def __init__(self, sock, protocol, client, server, sessionno, reactor):
         """
         Server(sock, protocol, client, server, sessionno)
@@ -770,14 +787,20 @@ class Server(Connection):
 
         This indicates the server's address.
         """
-        return address.IPv4Address('TCP', *(self.socket.getsockname() + ('INET',)))
+        if self._host is None:
+            self._host = address.IPv4Address(
+                'TCP', *(self.socket.getsockname() + ('INET',)))
+        return self._host
 
     def getPeer(self):
         """Returns an IPv4Address.
 
         This indicates the client's address.
         """
-        return address.IPv4Address('TCP', *(self.client + ('INET',)))
+        if self._peer is None:
+            self._peer = address.IPv4Address(
+                'TCP', *(self.client + ('INET',)))
+        return self._peer
 
 class Port(base.BasePort, _SocketCloser):
     """
@@ -819,14 +842,21 @@ class Port(base.BasePort, _SocketCloser):
     # value when we are actually listening.
     _realPortNumber = None
 
-    def __init__(self, port, factory, backlog=50, interface='', reactor=None):
+    def __init__(self, port, factory, backlog=50, interface='', reactor=None,
+                 listenMultiple=False):
         """Initialize with a numeric port to listen on.
+
+        @param listenMultiple: If true and the platform supports
+            C{SO_REUSEPORT}, several ports (typically one in each of a group
+            of processes) may listen on the same address at once, and the
+            kernel spreads incoming connections between them.
         """
         base.BasePort.__init__(self, reactor=reactor)
         self.port = port
         self.factory = factory
         self.backlog = backlog
         self.interface = interface
+        self.listenMultiple = listenMultiple
 
     def __repr__(self):
         if self._realPortNumber is not None:
@@ -839,6 +869,8 @@ class Port(base.BasePort, _SocketCloser):
         s = base.BasePort.createInternetSocket(self)
         if platformType == "posix" and sys.platform != "cygwin":
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.listenMultiple and hasattr(socket, "SO_REUSEPORT"):
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         return s
 
 
@@ -889,13 +921,16 @@ class Port(base.BasePort, _SocketCloser):
                 # win32 event loop breaks if we do more than one accept()
                 # in an iteration of the event loop.
                 numAccepts = 1
-            for i in range(numAccepts):
+            accept = self.socket.accept
+            buildProtocol = self.factory.buildProtocol
+            buildAddr = self._buildAddr
+            for i in xrange(numAccepts):
                 # we need this so we can deal with a factory's buildProtocol
                 # calling our loseConnection
                 if self.disconnecting:
                     return
                 try:
-                    skt, addr = self.socket.accept()
+                    skt, addr = accept()
                 except socket.error, e:
                     if e.args[0] in (EWOULDBLOCK, EAGAIN):
                         self.numberAccepts = i
@@ -927,7 +962,7 @@ class Port(base.BasePort, _SocketCloser):
                     raise
 
                 fdesc._setCloseOnExec(skt.fileno())
-                protocol = self.factory.buildProtocol(self._buildAddr(addr))
+                protocol = buildProtocol(buildAddr(addr))
                 if protocol is None:
                     skt.close()
                     continue
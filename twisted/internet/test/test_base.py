@@ -12,9 +12,10 @@ from zope.interface import implements
 
 from twisted.python.threadpool import ThreadPool
 from twisted.python.util import setIDFunction
-from twisted.internet.interfaces import IReactorTime, IReactorThreads
+from twisted.internet.interfaces import IReactorTime, IReactorThreads, IResolverSimple
 from twisted.internet.error import DNSLookupError
-from twisted.internet.base import ThreadedResolver, DelayedCall
+from twisted.internet.base import ThreadedResolver, DelayedCall, CachingResolver
+from twisted.internet.defer import succeed, fail
 from twisted.internet.task import Clock
 from twisted.trial.unittest import TestCase
 
@@ -154,6 +155,133 @@ class ThreadedResolverTests(TestCase):
 
 
 
+class CountingResolver(object):
+    """
+    An L{IResolverSimple} which resolves every name to the same address and
+    records the names it is asked to resolve.
+    """
+    implements(IResolverSimple)
+
+    def __init__(self, address="10.0.0.1"):
+        self.address = address
+        self.lookups = []
+
+
+    def getHostByName(self, name, timeout=(1, 3, 11, 45)):
+        self.lookups.append(name)
+        if self.address is None:
+            return fail(DNSLookupError(name))
+        return succeed(self.address)
+
+
+
+class CachingResolverTests(TestCase):
+    """
+    Tests for L{CachingResolver}.
+    """
+    def setUp(self):
+        self.clock = Clock()
+        self.wrapped = CountingResolver()
+        self.resolver = CachingResolver(self.wrapped, self.clock, ttl=10,
+                                        size=2)
+
+
+    def _lookup(self, name):
+        results = []
+        self.resolver.getHostByName(name).addCallback(results.append)
+        return results
+
+
+    def test_interface(self):
+        """
+        L{CachingResolver} provides L{IResolverSimple}.
+        """
+        self.assertTrue(IResolverSimple.providedBy(self.resolver))
+
+
+    def test_cached(self):
+        """
+        A second lookup of the same name within C{ttl} seconds is answered
+        without asking the wrapped resolver.
+        """
+        self.assertEqual(self._lookup("example.com"), ["10.0.0.1"])
+        self.clock.advance(9)
+        self.assertEqual(self._lookup("example.com"), ["10.0.0.1"])
+        self.assertEqual(self.wrapped.lookups, ["example.com"])
+
+
+    def test_expired(self):
+        """
+        Once C{ttl} seconds have passed, the wrapped resolver is asked again.
+        """
+        self._lookup("example.com")
+        self.clock.advance(10)
+        self.wrapped.address = "10.0.0.2"
+        self.assertEqual(self._lookup("example.com"), ["10.0.0.2"])
+        self.assertEqual(self.wrapped.lookups, ["example.com", "example.com"])
+
+
+    def test_failureNotCached(self):
+        """
+        Failed lookups are not remembered.
+        """
+        self.wrapped.address = None
+        d = self.resolver.getHostByName("example.com")
+        self.assertFailure(d, DNSLookupError)
+        self.wrapped.address = "10.0.0.1"
+        self.assertEqual(self._lookup("example.com"), ["10.0.0.1"])
+        self.assertEqual(self.wrapped.lookups, ["example.com", "example.com"])
+        return d
+
+
+    def test_size(self):
+        """
+        No more than C{size} names are cached; the one which expires soonest
+        is discarded to make room for a new one.
+        """
+        self._lookup("a.example.com")
+        self.clock.advance(1)
+        self._lookup("b.example.com")
+        self._lookup("c.example.com")
+        self.assertEqual(
+            sorted(self.resolver._cache.keys()),
+            ["b.example.com", "c.example.com"])
+
+
+    def test_evictExpiredFirst(self):
+        """
+        When the cache is full, expired entries are dropped to make room for a
+        new name and, if none have expired, only the oldest live entry is
+        dropped.
+        """
+        resolver = CachingResolver(self.wrapped, self.clock, ttl=10, size=3)
+        for name in ["a", "b", "c"]:
+            resolver.getHostByName(name)
+            self.clock.advance(1)
+        resolver.getHostByName("d")
+        self.assertEqual(sorted(resolver._cache.keys()), ["b", "c", "d"])
+        self.clock.advance(9)
+        resolver.getHostByName("e")
+        self.assertEqual(sorted(resolver._cache.keys()), ["d", "e"])
+
+
+    def test_sharedCache(self):
+        """
+        L{CachingResolver}s given the same C{cache} answer lookups from each
+        other's results.
+        """
+        cache = {}
+        first = CachingResolver(self.wrapped, self.clock, cache=cache)
+        second = CachingResolver(CountingResolver("10.0.0.2"), self.clock,
+                                 cache=cache)
+        first.getHostByName("example.com")
+        results = []
+        second.getHostByName("example.com").addCallback(results.append)
+        self.assertEqual(results, ["10.0.0.1"])
+        self.assertEqual(second.resolver.lookups, [])
+
+
+
 class DelayedCallTests(TestCase):
     """
     Tests for L{DelayedCall}.
@@ -0,0 +1,101 @@
+# Copyright (c) 2009 Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Tests for L{twisted.internet.default}.
+"""
+
+import os, sys
+
+from twisted.trial import unittest
+from twisted.internet import main, selectreactor, utils
+from twisted.internet.default import _getInstallFunction, _installEPollOrSelect
+
+try:
+    from twisted.internet import epollreactor
+except ImportError:
+    epollreactor = None
+
+
+
+def _expectedReactorName():
+    """
+    Return the class name of the reactor a fresh process on this platform
+    should install by default.
+    """
+    if epollreactor is not None and sys.platform.startswith('linux'):
+        try:
+            epollreactor._newPoller(1).close()
+        except (IOError, OSError):
+            pass
+        else:
+            return 'EPollReactor'
+    return 'SelectReactor'
+
+
+
+class FakeReactor(object):
+    """
+    A stand-in for a reactor class which records nothing and opens no file
+    descriptors.
+    """
+
+
+
+class DefaultReactorTests(unittest.TestCase):
+    """
+    Tests for the selection and installation of the default reactor.
+    """
+
+    def test_importInstallsDefaultReactor(self):
+        """
+        Importing L{twisted.internet.reactor} in a process which has not
+        installed a reactor installs the default one for the platform.
+        """
+        source = (
+            "import sys\n"
+            "from twisted.internet import reactor\n"
+            "sys.stdout.write(reactor.__class__.__name__)\n")
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(sys.path)
+        d = utils.getProcessOutput(sys.executable, ['-c', source], env)
+        d.addCallback(self.assertEquals, _expectedReactorName())
+        return d
+
+
+    def test_nonLinux(self):
+        """
+        On platforms other than Linux the select reactor is installed.
+        """
+        self.assertIdentical(_getInstallFunction('win32'),
+                             selectreactor.install)
+        self.assertIdentical(_getInstallFunction('darwin'),
+                             selectreactor.install)
+
+
+    def test_linux(self):
+        """
+        On Linux the epoll reactor is installed if it can be imported.
+        """
+        self.assertIdentical(_getInstallFunction('linux2'),
+                             _installEPollOrSelect)
+    if epollreactor is None:
+        test_linux.skip = "epollreactor cannot be imported"
+
+
+    def test_epollCreationFails(self):
+        """
+        If creating the epoll reactor fails with an I/O error,
+        L{_installEPollOrSelect} installs a select reactor instead.
+        """
+        installed = []
+        def brokenEPoll():
+            raise IOError("epoll unavailable")
+        self.patch(epollreactor, 'EPollReactor', brokenEPoll)
+        self.patch(selectreactor, 'SelectReactor', FakeReactor)
+        self.patch(main, 'installReactor', installed.append)
+        _installEPollOrSelect()
+        self.assertEquals(len(installed), 1)
+        self.assertIsInstance(installed[0], FakeReactor)
+    if epollreactor is None:
+        test_epollCreationFails.skip = "epollreactor cannot be imported"
@@ -89,6 +89,27 @@ class IOCPReactorTestCase(unittest.TestCase):
                 .addCallback(proceed, p))
 
 
+    def test_concurrentAccepts(self):
+        """
+        More simultaneous connection attempts than L{tcp.Port.pendingAccepts}
+        are all accepted.
+        """
+        from twisted.internet.iocpreactor import tcp
+        sf = ServerFactory()
+        sf.protocol = Protocol
+        p = reactor.listenTCP(0, sf)
+        self.addCleanup(p.stopListening)
+        port = p.getHost().port
+        cc = ClientCreator(reactor, Protocol)
+        ds = [cc.connectTCP('127.0.0.1', port)
+              for i in range(tcp.Port.pendingAccepts * 2)]
+        def connected(results):
+            for success, proto in results:
+                self.assertTrue(success)
+                proto.transport.loseConnection()
+        return DeferredList(ds).addCallback(connected)
+
+
     def test_reactorInterfaces(self):
         """
         Verify that IOCP socket-representing classes implement IReadWriteHandle
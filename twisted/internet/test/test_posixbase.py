@@ -5,7 +5,10 @@
 Tests for L{twisted.internet.posixbase} and supporting code.
 """
 
+import os
+
 from twisted.python.compat import set
+from twisted.python.runtime import platformType
 from twisted.trial.unittest import TestCase
 from twisted.internet.posixbase import PosixReactorBase, _Waker
 from twisted.internet.protocol import ServerFactory
@@ -90,6 +93,54 @@ class PosixReactorBaseTests(TestCase):
 
 
 
+class WakerTests(TestCase):
+    """
+    Tests for the L{_Waker} used by L{PosixReactorBase}.
+    """
+    if platformType != "posix":
+        skip = "Pipe-based waker only used on POSIX"
+
+    def setUp(self):
+        self.waker = _Waker(None)
+
+
+    def tearDown(self):
+        self.waker.connectionLost(None)
+
+
+    def _pendingBytes(self):
+        """
+        Read and return whatever has been written to the waker's pipe.
+        """
+        try:
+            return os.read(self.waker.fileno(), 8192)
+        except OSError:
+            return ""
+
+
+    def test_wakeUpCoalesced(self):
+        """
+        Calls to L{_Waker.wakeUp} made before the waker is read write only
+        one byte to its pipe.
+        """
+        self.waker.wakeUp()
+        self.waker.wakeUp()
+        self.waker.wakeUp()
+        self.assertEqual(self._pendingBytes(), "x")
+
+
+    def test_wakeUpAfterRead(self):
+        """
+        Once L{_Waker.doRead} has run, L{_Waker.wakeUp} writes to the pipe
+        again.
+        """
+        self.waker.wakeUp()
+        self.waker.doRead()
+        self.waker.wakeUp()
+        self.assertEqual(self._pendingBytes(), "x")
+
+
+
 class TCPPortTests(TestCase):
     """
     Tests for L{twisted.internet.tcp.Port}.
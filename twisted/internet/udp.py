@@ -108,9 +108,15 @@ class Port(base.BasePort):
     def doRead(self):
         """Called when my socket is ready for reading."""
         read = 0
-        while read < self.maxThroughput:
+        # Look these up once rather than once per datagram.  The socket is
+        # only closed by connectionLost, which never runs during this loop.
+        recvfrom = self.socket.recvfrom
+        maxPacketSize = self.maxPacketSize
+        maxThroughput = self.maxThroughput
+        datagramReceived = self.protocol.datagramReceived
+        while read < maxThroughput:
             try:
-                data, addr = self.socket.recvfrom(self.maxPacketSize)
+                data, addr = recvfrom(maxPacketSize)
             except socket.error, se:
                 no = se.args[0]
                 if no in (EAGAIN, EINTR, EWOULDBLOCK):
@@ -123,7 +129,7 @@ class Port(base.BasePort):
             else:
                 read += len(data)
                 try:
-                    self.protocol.datagramReceived(data, addr)
+                    datagramReceived(data, addr)
                 except:
                     log.err()
 
@@ -3,7 +3,7 @@
 
 
 from itertools import count
-import re, os, cStringIO, time, cgi, string, urlparse
+import os, cStringIO, time, cgi, string, urlparse
 from xml.dom import minidom as dom
 from xml.sax.handler import ErrorHandler, feature_validation
 from xml.dom.pulldom import SAX2DOM
@@ -50,7 +50,7 @@ def fixLinks(document, ext):
             continue
 
         # This is a relative link, so it should be munged.
-        if href.endswith('html') or href[:href.rfind('#')].endswith('html'):
+        if href.endswith('html') or href.endswith('html', 0, href.rfind('#')):
             fname, fext = os.path.splitext(href)
             if '#' in fext:
                 fext = ext+'#'+fext.split('#', 1)[1]
@@ -161,10 +161,11 @@ def fontifyPythonNode(node):
     oldio = cStringIO.StringIO()
     latex.getLatexText(node, oldio.write,
                        entities={'lt': '<', 'gt': '>', 'amp': '&'})
-    oldio = cStringIO.StringIO(oldio.getvalue().strip()+'\n')
-    howManyLines = len(oldio.getvalue().splitlines())
+    source = oldio.getvalue().strip() + '\n'
+    howManyLines = len(source.splitlines())
     newio = cStringIO.StringIO()
-    htmlizer.filter(oldio, newio, writer=htmlizer.SmallerHTMLWriter)
+    htmlizer.filter(cStringIO.StringIO(source), newio,
+                    writer=htmlizer.SmallerHTMLWriter)
     lineLabels = _makeLineNumbers(howManyLines)
     newel = dom.parseString(newio.getvalue()).documentElement
     newel.setAttribute("class", "python")
@@ -314,8 +315,7 @@ def getHeaders(document):
     @rtype: C{list}
     """
     return domhelpers.findElements(
-        document,
-        lambda n, m=re.compile('h[23]$').match: m(n.nodeName))
+        document, lambda n: n.nodeName in ('h2', 'h3'))
 
 
 
@@ -693,11 +693,14 @@ def fixRelativeLinks(document, linkrel):
     C{href} attributes in the input document when generating the output
     document.
     """
-    for attr in 'src', 'href':
-        for node in domhelpers.findElementsWithAttribute(document, attr):
+    matcher = lambda n: n.hasAttribute('src') or n.hasAttribute('href')
+    for node in domhelpers.findElements(document, matcher):
+        for attr in 'src', 'href':
+            if not node.hasAttribute(attr):
+                continue
             href = node.getAttribute(attr)
             if not href.startswith('http') and not href.startswith('/'):
-                node.setAttribute(attr, linkrel+node.getAttribute(attr))
+                node.setAttribute(attr, linkrel + href)
 
 
 
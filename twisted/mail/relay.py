@@ -58,11 +58,10 @@ class DomainQueuer:
 
 class RelayerMixin:
 
-    # XXX - This is -totally- bogus
-    # It opens about a -hundred- -billion- files
-    # and -leaves- them open!
-
     def loadMessages(self, messagePaths):
+        # Only the envelopes are read here.  The message data files are
+        # opened one at a time by getMailData, so a large batch does not
+        # hold a file descriptor for every message it has yet to send.
         self.messages = []
         self.names = []
         for message in messagePaths:
@@ -71,8 +70,7 @@ class RelayerMixin:
                 messageContents = pickle.load(fp)
             finally:
                 fp.close()
-            fp = open(message+'-D')
-            messageContents.append(fp)
+            messageContents.append(message+'-D')
             self.messages.append(messageContents)
             self.names.append(message)
     
@@ -89,7 +87,7 @@ class RelayerMixin:
     def getMailData(self):
         if not self.messages:
             return None
-        return self.messages[0][2]
+        return open(self.messages[0][2])
 
     def sentMail(self, code, resp, numOk, addresses, log):
         """Since we only use one recipient per envelope, this
@@ -86,9 +86,12 @@ class DummyMessage(object):
         self.buffer = []
 
 
+    _receivedHeader = re.compile(
+        'Received: From yyy.com \(\[.*\]\) by localhost;')
+
     def lineReceived(self, line):
         # Throw away the generated Received: header
-        if not re.match('Received: From yyy.com \(\[.*\]\) by localhost;', line):
+        if not self._receivedHeader.match(line):
             self.buffer.append(line)
 
 
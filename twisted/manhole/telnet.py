@@ -10,7 +10,7 @@ from twisted.internet import protocol
 from twisted.python import log, failure
 
 # system imports
-import string, copy, sys
+import sys
 from cStringIO import StringIO
 
 
@@ -35,7 +35,7 @@ class Shell(telnet.Telnet):
     def telnet_Command(self, cmd):
         if self.lineBuffer:
             if not cmd:
-                cmd = string.join(self.lineBuffer, '\n') + '\n\n\n'
+                cmd = '\n'.join(self.lineBuffer) + '\n\n\n'
                 self.doCommand(cmd)
                 self.lineBuffer = []
                 return "Command"
@@ -84,9 +84,9 @@ class Shell(telnet.Telnet):
         
         self.factory.namespace['_'] = result
         if result is not None:
-            self.transport.write(repr(result))
-            self.transport.write('\r\n')
-        self.transport.write(">>> ")
+            self.transport.write(repr(result) + '\r\n>>> ')
+        else:
+            self.transport.write(">>> ")
 
 
 
@@ -109,9 +109,9 @@ class ShellFactory(protocol.Factory):
     def __getstate__(self):
         """This returns the persistent state of this shell factory.
         """
-        dict = self.__dict__
-        ns = copy.copy(dict['namespace'])
-        dict['namespace'] = ns
-        if ns.has_key('__builtins__'):
+        dict = self.__dict__.copy()
+        ns = dict['namespace'].copy()
+        if '__builtins__' in ns:
             del ns['__builtins__']
+        dict['namespace'] = ns
         return dict
@@ -239,12 +239,38 @@ class Resolver(common.ResolverBase):
 
 
     def connectionMade(self, protocol):
+        """
+        Called from L{DNSProtocol} when a TCP connection to a nameserver has
+        been made.  Queries waiting for the connection are sent over it.
+        """
         self.connections.append(protocol)
         for (d, q, t) in self.pending:
             self.queryTCP(q, t).chainDeferred(d)
         del self.pending[:]
 
 
+    def connectionLost(self, protocol):
+        """
+        Called from L{DNSProtocol} when its TCP connection is lost, so that
+        later queries do not try to use it.
+        """
+        if protocol in self.connections:
+            self.connections.remove(protocol)
+
+
+    def connectionFailed(self, reason):
+        """
+        Called from L{DNSClientFactory} when a TCP connection attempt
+        fails.  Every query waiting for that connection fails with
+        C{reason}.
+        """
+        # Take the list first, in case an errback issues another TCP query.
+        pending = self.pending[:]
+        del self.pending[:]
+        for (d, q, t) in pending:
+            d.errback(reason)
+
+
     def messageReceived(self, message, protocol, address = None):
         log.msg("Unexpected message (%d) received from %r" % (message.id, address))
 
@@ -344,12 +370,17 @@ class Resolver(common.ResolverBase):
 
         @rtype: C{Deferred}
         """
+        # Queries share one connection and are matched to their responses
+        # by message ID, so only connect if no connection is open or being
+        # made.
         if not len(self.connections):
-            address = self.pickServer()
-            if address is None:
-                return defer.fail(IOError("No domain name servers available"))
-            host, port = address
-            self._reactor.connectTCP(host, port, self.factory)
+            if not self.pending:
+                address = self.pickServer()
+                if address is None:
+                    return defer.fail(
+                        IOError("No domain name servers available"))
+                host, port = address
+                self._reactor.connectTCP(host, port, self.factory)
             self.pending.append((defer.Deferred(), queries, timeout))
             return self.pending[-1][0]
         else:
@@ -511,6 +542,16 @@ class DNSClientFactory(protocol.ClientFactory):
         pass
 
 
+    def clientConnectionFailed(self, connector, reason):
+        """
+        Tell the controller that the connection attempt failed, if it wants
+        to know.
+        """
+        connectionFailed = getattr(self.controller, 'connectionFailed', None)
+        if connectionFailed is not None:
+            connectionFailed(reason)
+
+
     def buildProtocol(self, addr):
         p = dns.DNSProtocol(self.controller)
         p.factory = self
@@ -658,6 +699,27 @@ def lookupMailExchange(name, timeout=None):
     """
     return getResolver().lookupMailExchange(name, timeout)
 
+def lookupMailExchangeAddresses(name, timeout=None):
+    """
+    Perform an MX record lookup, then look up the IPv4 addresses of all the
+    mail exchanges found in parallel.  Addresses included in the additional
+    section of the MX response are used without another query.
+
+    @type name: C{str}
+    @param name: DNS name to resolve.
+
+    @type timeout: Sequence of C{int}
+    @param timeout: Number of seconds after which to reissue the query.
+    When the last timeout expires, the query is considered failed.
+
+    @rtype: C{Deferred}
+    @return: A L{Deferred} which fires with a C{list} of three-tuples of the
+        preference, name and C{list} of dotted-quad addresses of each mail
+        exchange, in order of preference.  An exchange whose address lookup
+        failed has an empty C{list} of addresses.
+    """
+    return getResolver().lookupMailExchangeAddresses(name, timeout)
+
 def lookupNameservers(name, timeout=None):
     """
     Perform an NS record lookup.
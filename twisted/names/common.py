@@ -52,6 +52,47 @@ class ResolverBase:
         """
         return self._lookup(name, dns.IN, dns.MX, timeout)
 
+    def lookupMailExchangeAddresses(self, name, timeout = None):
+        """
+        @see: twisted.names.client.lookupMailExchangeAddresses
+        """
+        d = self.lookupMailExchange(name, timeout)
+        d.addCallback(self._cbMailExchanges, timeout)
+        return d
+
+    def _cbMailExchanges(self, (ans, auth, add), timeout):
+        """
+        Issue an address lookup for every exchange named in an MX answer
+        which did not come with its addresses, all at once, and collect the
+        results.
+        """
+        known = {}
+        for r in add:
+            if r.type == dns.A:
+                known.setdefault(str(r.name), []).append(r.payload.dottedQuad())
+        exchanges = [(r.payload.preference, str(r.payload.name))
+                     for r in ans if r.type == dns.MX]
+        exchanges.sort()
+
+        lookups = []
+        for (preference, exchange) in exchanges:
+            if exchange in known:
+                lookups.append(defer.succeed(known[exchange]))
+            else:
+                lookups.append(self.lookupAddress(exchange, timeout
+                    ).addCallback(self._cbExchangeAddresses))
+        d = defer.DeferredList(lookups, consumeErrors=True)
+        d.addCallback(self._cbAllExchangeAddresses, exchanges)
+        return d
+
+    def _cbExchangeAddresses(self, (ans, auth, add)):
+        return [r.payload.dottedQuad() for r in ans if r.type == dns.A]
+
+    def _cbAllExchangeAddresses(self, results, exchanges):
+        return [(preference, exchange, success and addresses or [])
+                for ((preference, exchange), (success, addresses))
+                in zip(exchanges, results)]
+
     def lookupNameservers(self, name, timeout = None):
         """
         @see: twisted.names.client.lookupNameservers
@@ -112,6 +112,13 @@ REV_CLASSES = dict([
     (v, k) for (k, v) in QUERY_CLASSES.items()
 ])
 
+# The type and class fields of a query, packed once here for every known
+# type in the IN class so that Query.encode need not pack them each time.
+_QUERY_TAILS = dict([
+    ((t, IN), struct.pack("!HH", t, IN))
+    for t in QUERY_TYPES.keys() + EXT_QUERIES.keys()
+])
+
 
 # Opcodes
 OP_QUERY, OP_INVERSE, OP_STATUS = range(3)
@@ -369,7 +376,10 @@ class Query:
 
     def encode(self, strio, compDict=None):
         self.name.encode(strio, compDict)
-        strio.write(struct.pack("!HH", self.type, self.cls))
+        tail = _QUERY_TAILS.get((self.type, self.cls))
+        if tail is None:
+            tail = struct.pack("!HH", self.type, self.cls)
+        strio.write(tail)
 
 
     def decode(self, strio, length = None):
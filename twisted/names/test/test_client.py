@@ -6,7 +6,7 @@ Test cases for L{twisted.names.client}.
 """
 
 from twisted.names import client, dns
-from twisted.names.error import DNSQueryTimeoutError
+from twisted.names.error import DNSQueryTimeoutError, DNSNameError
 from twisted.trial import unittest
 from twisted.names.common import ResolverBase
 from twisted.internet import defer, error
@@ -36,6 +36,41 @@ class FakeResolver(ResolverBase):
 
 
 
+class MailExchangeResolver(ResolverBase):
+    """
+    A resolver with an MX record for C{example.com} naming two exchanges.
+    The address of one is given in the additional section, the address of
+    the other must be looked up, and an A lookup of any other name fails.
+
+    @ivar lookups: A C{list} of the names and types of the queries made.
+    """
+    def __init__(self):
+        ResolverBase.__init__(self)
+        self.lookups = []
+
+
+    def _lookup(self, name, cls, qtype, timeout):
+        self.lookups.append((name, qtype))
+        if qtype == dns.MX and name == 'example.com':
+            return defer.succeed((
+                [dns.RRHeader(name, dns.MX, payload=dns.Record_MX(
+                            20, 'mx2.example.com')),
+                 dns.RRHeader(name, dns.MX, payload=dns.Record_MX(
+                            10, 'mx1.example.com')),
+                 dns.RRHeader(name, dns.MX, payload=dns.Record_MX(
+                            30, 'mx3.example.com'))],
+                [],
+                [dns.RRHeader('mx1.example.com', dns.A, payload=dns.Record_A(
+                            '10.0.0.1'))]))
+        if qtype == dns.A and name == 'mx2.example.com':
+            return defer.succeed((
+                [dns.RRHeader(name, dns.A, payload=dns.Record_A(
+                            '10.0.0.2'))],
+                [], []))
+        return defer.fail(DNSNameError(name))
+
+
+
 class StubPort(object):
     """
     A partial implementation of L{IListeningPort} which only keeps track of
@@ -415,6 +450,106 @@ class ResolverTests(unittest.TestCase):
         return self.assertFailure(queryResult, ExpectedException)
 
 
+    def _tcpResolver(self):
+        """
+        Return a L{client.Resolver} whose reactor records TCP connection
+        attempts in the C{connects} attribute of the returned resolver.
+        """
+        resolver = client.Resolver(servers=[('example.com', 53)])
+        resolver.connects = []
+
+        class FakeReactor(object):
+            def connectTCP(self, host, port, factory):
+                resolver.connects.append((host, port, factory))
+
+        resolver._reactor = FakeReactor()
+        return resolver
+
+
+    def test_tcpConnectionShared(self):
+        """
+        TCP queries issued while a connection attempt is in progress wait for
+        that connection instead of starting another one.
+        """
+        resolver = self._tcpResolver()
+        resolver.queryTCP([dns.Query('foo.example.com')])
+        resolver.queryTCP([dns.Query('bar.example.com')])
+        self.assertEqual(len(resolver.connects), 1)
+        self.assertEqual(len(resolver.pending), 2)
+
+
+    def test_tcpConnectionFailed(self):
+        """
+        If the TCP connection attempt fails, every query waiting for it fails
+        with the same reason, and the next query makes a new attempt.
+        """
+        resolver = self._tcpResolver()
+        first = resolver.queryTCP([dns.Query('foo.example.com')])
+        second = resolver.queryTCP([dns.Query('bar.example.com')])
+        factory = resolver.connects[0][2]
+        factory.clientConnectionFailed(
+            None, failure.Failure(error.ConnectionRefusedError()))
+        self.assertEqual(resolver.pending, [])
+
+        resolver.queryTCP([dns.Query('baz.example.com')])
+        self.assertEqual(len(resolver.connects), 2)
+
+        return defer.gatherResults([
+            self.assertFailure(first, error.ConnectionRefusedError),
+            self.assertFailure(second, error.ConnectionRefusedError)])
+
+
+    def test_tcpConnectionLost(self):
+        """
+        A L{dns.DNSProtocol} whose connection is lost is no longer used for
+        TCP queries.
+        """
+        resolver = self._tcpResolver()
+        protocol = dns.DNSProtocol(resolver)
+        resolver.connections.append(protocol)
+        protocol.connectionLost(
+            failure.Failure(error.ConnectionDone()))
+        self.assertEqual(resolver.connections, [])
+
+        resolver.queryTCP([dns.Query('foo.example.com')])
+        self.assertEqual(len(resolver.connects), 1)
+
+
+
+class MailExchangeAddressesTests(unittest.TestCase):
+    """
+    Tests for L{ResolverBase.lookupMailExchangeAddresses}.
+    """
+    def test_addresses(self):
+        """
+        The exchanges of the MX answer are returned in order of preference
+        with their addresses, taken from the additional section where
+        possible and otherwise looked up.  An exchange whose address lookup
+        fails has no addresses.
+        """
+        resolver = MailExchangeResolver()
+        d = resolver.lookupMailExchangeAddresses('example.com')
+        def check(result):
+            self.assertEqual(result, [
+                    (10, 'mx1.example.com', ['10.0.0.1']),
+                    (20, 'mx2.example.com', ['10.0.0.2']),
+                    (30, 'mx3.example.com', [])])
+            self.assertEqual(sorted(resolver.lookups), [
+                    ('example.com', dns.MX),
+                    ('mx2.example.com', dns.A),
+                    ('mx3.example.com', dns.A)])
+        return d.addCallback(check)
+
+
+    def test_noMailExchange(self):
+        """
+        If the MX lookup fails, so does the L{Deferred} returned.
+        """
+        resolver = MailExchangeResolver()
+        d = resolver.lookupMailExchangeAddresses('example.org')
+        return self.assertFailure(d, DNSNameError)
+
+
 
 class ClientTestCase(unittest.TestCase):
 
@@ -90,24 +90,25 @@ class TuntapPort(base.BasePort):
     def doRead(self):
         """Called when my socket is ready for reading."""
         read = 0
-        while read < self.maxThroughput:
+        osRead = os.read
+        fd = self.fd
+        maxPacketSize = self.maxPacketSize
+        maxThroughput = self.maxThroughput
+        datagramReceived = self.protocol.datagramReceived
+        while read < maxThroughput:
             try:
-                data = os.read(self.fd, self.maxPacketSize)
-                read += len(data)
-#                pkt = TuntapPacketInfo(data)
-                self.protocol.datagramReceived(data,
-                                               partial=0 # pkt.isPartial(),
-                                               )
-            except OSError, e:
-                if e.errno in (errno.EWOULDBLOCK,):
-                    return
-                else:
-                    raise
-            except IOError, e:
-                if e.errno in (errno.EAGAIN, errno.EINTR):
+                data = osRead(fd, maxPacketSize)
+            except (OSError, IOError), e:
+                if e.errno in (errno.EWOULDBLOCK, errno.EAGAIN, errno.EINTR):
                     return
                 else:
                     raise
+            read += len(data)
+#            pkt = TuntapPacketInfo(data)
+            try:
+                datagramReceived(data,
+                                 partial=0 # pkt.isPartial(),
+                                 )
             except:
                 log.deferr()
 
@@ -5,10 +5,12 @@ from twisted.application.reactors import Reactor
 
 default = Reactor(
     'default', 'twisted.internet.default',
-    'The best reactor for the current platform.')
+    'The best reactor for the current platform: epoll on Linux, '
+    'select elsewhere.')
 
 select = Reactor(
-    'select', 'twisted.internet.selectreactor', 'select(2)-based reactor.')
+    'select', 'twisted.internet.selectreactor',
+    'select(2)-based reactor (the default except on Linux).')
 wx = Reactor(
     'wx', 'twisted.internet.wxreactor', 'wxPython integration reactor.')
 gtk = Reactor(
@@ -27,7 +29,8 @@ win32er = Reactor(
 poll = Reactor(
     'poll', 'twisted.internet.pollreactor', 'poll(2)-based reactor.')
 epoll = Reactor(
-    'epoll', 'twisted.internet.epollreactor', 'epoll(4)-based reactor.')
+    'epoll', 'twisted.internet.epollreactor',
+    'epoll(4)-based reactor (the default on Linux).')
 cf = Reactor(
     'cf' , 'twisted.internet.cfreactor',
     'CoreFoundation integration reactor.')
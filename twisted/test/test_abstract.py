@@ -7,7 +7,7 @@ Tests for generic file descriptor based reactor support code.
 
 from twisted.trial.unittest import TestCase
 
-from twisted.internet.abstract import isIPAddress
+from twisted.internet.abstract import isIPAddress, FileDescriptor
 
 
 class AddressTests(TestCase):
@@ -81,3 +81,145 @@ class AddressTests(TestCase):
         self.assertFalse(isIPAddress('0.0.256.0'))
         self.assertFalse(isIPAddress('0.0.0.256'))
         self.assertFalse(isIPAddress('256.256.256.256'))
+
+
+class MemoryReactor(object):
+    """
+    A reactor which only records the writers added to it.
+    """
+    def __init__(self):
+        self.writers = []
+
+
+    def addWriter(self, writer):
+        if writer not in self.writers:
+            self.writers.append(writer)
+
+
+    def removeWriter(self, writer):
+        if writer in self.writers:
+            self.writers.remove(writer)
+
+
+class PartialWriteDescriptor(FileDescriptor):
+    """
+    A L{FileDescriptor} which accepts at most C{limit} bytes per write.
+    """
+    connected = True
+    limit = 4
+
+    def __init__(self, reactor):
+        FileDescriptor.__init__(self, reactor)
+        self.written = []
+
+
+    def writeSomeData(self, data):
+        data = str(data)[:self.limit]
+        self.written.append(data)
+        return len(data)
+
+
+class WriteSequenceTests(TestCase):
+    """
+    Tests for L{FileDescriptor.writeSequence} and the buffering done by
+    L{FileDescriptor.doWrite}.
+    """
+    def setUp(self):
+        self.reactor = MemoryReactor()
+        self.descriptor = PartialWriteDescriptor(self.reactor)
+
+
+    def test_bufferedLength(self):
+        """
+        L{FileDescriptor.writeSequence} counts the length of every chunk in
+        the sequence and starts writing.
+        """
+        self.descriptor.writeSequence(["abc", "de", "f"])
+        self.assertEquals(self.descriptor._tempDataLen, 6)
+        self.assertEquals(self.reactor.writers, [self.descriptor])
+
+
+    def test_partialWrites(self):
+        """
+        Data written by L{FileDescriptor.writeSequence} and
+        L{FileDescriptor.write} is sent in order across partial writes, and
+        writing stops once everything has been sent.
+        """
+        self.descriptor.writeSequence(["abc", "de"])
+        self.descriptor.doWrite()
+        self.descriptor.write("fgh")
+        self.descriptor.writeSequence(["ij", "k"])
+        while self.reactor.writers:
+            self.descriptor.doWrite()
+        self.assertEquals("".join(self.descriptor.written), "abcdefghijk")
+        self.assertEquals(self.descriptor.written[:2], ["abcd", "efgh"])
+
+
+class PausingProducer(object):
+    """
+    A streaming producer which counts how often it is paused and resumed.
+    """
+    def __init__(self):
+        self.pauses = 0
+        self.resumes = 0
+
+
+    def pauseProducing(self):
+        self.pauses += 1
+
+
+    def resumeProducing(self):
+        self.resumes += 1
+
+
+    def stopProducing(self):
+        pass
+
+
+class ProducerTests(TestCase):
+    """
+    Tests for the flow control L{FileDescriptor} applies to a registered
+    streaming producer.
+    """
+    def setUp(self):
+        self.descriptor = PartialWriteDescriptor(MemoryReactor())
+        self.descriptor.bufferSize = 5
+        self.producer = PausingProducer()
+        self.descriptor.registerProducer(self.producer, True)
+
+
+    def test_pausedOnce(self):
+        """
+        A streaming producer is paused once when the buffer passes
+        C{bufferSize}, not again on each further write.
+        """
+        self.descriptor.write("abcdef")
+        self.descriptor.write("gh")
+        self.descriptor.writeSequence(["ij", "kl"])
+        self.assertEquals(self.producer.pauses, 1)
+
+
+    def test_pausedAgainAfterResume(self):
+        """
+        Once the buffer has been written out and the producer resumed, it is
+        paused again when the buffer next fills.
+        """
+        self.descriptor.write("abcdef")
+        while self.descriptor.reactor.writers:
+            self.descriptor.doWrite()
+        self.assertEquals(self.producer.resumes, 1)
+        self.descriptor.write("ghijkl")
+        self.assertEquals(self.producer.pauses, 2)
+
+
+    def test_newProducerNotPaused(self):
+        """
+        A producer registered after a paused one was unregistered is paused
+        when the buffer fills.
+        """
+        self.descriptor.write("abcdef")
+        self.descriptor.unregisterProducer()
+        producer = PausingProducer()
+        self.descriptor.registerProducer(producer, True)
+        self.descriptor.write("gh")
+        self.assertEquals(producer.pauses, 1)
@@ -220,6 +220,63 @@ class DeferredTestCase(unittest.TestCase):
 
         d1.addErrback(lambda e: None)  # Swallow error
 
+
+    def test_deferredListAllAlreadySucceeded(self):
+        """
+        A L{DeferredList} of L{Deferred}s which have all already succeeded
+        fires immediately with all of their results, and leaves the results
+        of those L{Deferred}s unchanged.
+        """
+        deferreds = [defer.succeed(1), defer.succeed(None), defer.succeed(3)]
+        dl = defer.DeferredList(deferreds, consumeErrors=True)
+        result = []
+        dl.addCallback(result.append)
+        self.assertEquals(
+            result,
+            [[(defer.SUCCESS, 1), (defer.SUCCESS, None), (defer.SUCCESS, 3)]])
+        self.assertEquals([d.result for d in deferreds], [1, None, 3])
+
+
+    def test_deferredListWithAlreadyFiredPausedDeferred(self):
+        """
+        A L{Deferred} which has a result but is paused is not counted as
+        finished by a L{DeferredList} until it is unpaused, and the result
+        recorded is the one produced by its callbacks.
+        """
+        d1 = defer.succeed(1)
+        d2 = defer.succeed(2)
+        d2.pause()
+        d2.addCallback(lambda result: result * 10)
+        dl = defer.DeferredList([d1, d2])
+        result = []
+        dl.addCallback(result.append)
+        self.assertEquals(result, [])
+        d2.unpause()
+        self.assertEquals(
+            result, [[(defer.SUCCESS, 1), (defer.SUCCESS, 20)]])
+
+
+    def test_deferredListWithNoneResults(self):
+        """
+        A L{DeferredList} fires exactly once, after the last of its
+        L{Deferred}s has fired, even if some of them fire with C{None}.
+        """
+        d1 = defer.Deferred()
+        d2 = defer.Deferred()
+        d3 = defer.Deferred()
+        dl = defer.DeferredList([d1, d2, d3])
+        result = []
+        dl.addCallback(result.append)
+        d1.callback(None)
+        d3.callback(None)
+        self.assertEquals(result, [])
+        d2.callback("2")
+        self.assertEquals(
+            result,
+            [[(defer.SUCCESS, None), (defer.SUCCESS, "2"),
+              (defer.SUCCESS, None)]])
+
+
     def testTimeOut(self):
         """
         Test that a Deferred which has setTimeout called on it and never has
@@ -236,6 +293,19 @@ class DeferredTestCase(unittest.TestCase):
     testTimeOut.suppress = [_setTimeoutSuppression]
 
 
+    def test_callbackCancelsTimeout(self):
+        """
+        Firing a L{Deferred} which has had C{setTimeout} called on it cancels
+        the pending timeout call.
+        """
+        d = defer.Deferred()
+        call = d.setTimeout(10)
+        d.callback(None)
+        self.failIf(call.active())
+        self.assertIdentical(d.timeoutCall, None)
+    test_callbackCancelsTimeout.suppress = [_setTimeoutSuppression]
+
+
     def testImmediateSuccess(self):
         l = []
         d = defer.succeed("success")
@@ -243,6 +313,65 @@ class DeferredTestCase(unittest.TestCase):
         self.assertEquals(l, ["success"])
 
 
+    def test_chainDeferred(self):
+        """
+        When a L{Deferred} is chained to another with C{chainDeferred}, the
+        result of the first is passed to the second, and the first is left
+        with a result of C{None}.
+        """
+        a = defer.Deferred()
+        b = defer.Deferred()
+        a.chainDeferred(b)
+        results = []
+        b.addCallback(results.append)
+        a.callback("result")
+        self.assertEquals(results, ["result"])
+        a.addCallback(results.append)
+        self.assertEquals(results, ["result", None])
+
+
+    def test_chainDeferredFailure(self):
+        """
+        A failure result of a L{Deferred} is passed to the errbacks of a
+        L{Deferred} chained to it with C{chainDeferred}.
+        """
+        a = defer.Deferred()
+        b = defer.Deferred()
+        a.chainDeferred(b)
+        failures = []
+        b.addErrback(failures.append)
+        a.errback(GenericError("failure"))
+        self.assertEquals(len(failures), 1)
+        failures[0].trap(GenericError)
+
+
+    def test_noDebugInfoWithoutFailure(self):
+        """
+        A L{Deferred} which never has a L{failure.Failure} result does not
+        allocate the L{defer.DebugInfo} whose C{__del__} reports unhandled
+        errors, so it never has a finalizer attached.
+        """
+        d = defer.succeed("success")
+        d.addCallback(lambda result: None)
+        self.assertIdentical(d._debugInfo, None)
+
+
+    def test_callbacksNotShared(self):
+        """
+        Callbacks added to one L{Deferred} are not visible to any other
+        L{Deferred}, even though no callback list is allocated until the
+        first callback is added.
+        """
+        l = []
+        first = defer.Deferred()
+        second = defer.Deferred()
+        first.addCallback(l.append)
+        second.callback("second")
+        self.assertEquals(l, [])
+        first.callback("first")
+        self.assertEquals(l, ["first"])
+
+
     def test_immediateSuccessBeforeTimeout(self):
         """
         Test that a synchronously successful Deferred is not affected by a
@@ -544,6 +673,24 @@ class AlreadyCalledTestCase(unittest.TestCase):
         self._err_1(d)
         self.failUnlessRaises(defer.AlreadyCalledError, self._call_2, d)
 
+    def test_alreadyCalledMaybeDeferred(self):
+        """
+        The L{Deferred} returned by L{defer.maybeDeferred} for a synchronous
+        result has already been called, and records its invoker when
+        debugging is enabled.
+        """
+        d = defer.maybeDeferred(self._maybeDeferredCall)
+        try:
+            self._call_2(d)
+        except defer.AlreadyCalledError, e:
+            lines = e.args[0].split("\n")
+            self._count('I', 'test_alreadyCalledMaybeDeferred', lines, 1)
+        else:
+            self.fail("second callback failed to raise AlreadyCalledError")
+
+    def _maybeDeferredCall(self):
+        return "hello"
+
 
     def _count(self, linetype, func, lines, expected):
         count = 0
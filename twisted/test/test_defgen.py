@@ -270,6 +270,23 @@ class InlineCallbacksTests(BaseDefgenTests, unittest.TestCase):
 
         return _return().addCallback(self.assertEqual, 6)
 
+    def test_yieldAlreadySucceeded(self):
+        """
+        Yielding a L{Deferred} which already has a result sends that result
+        back into the generator, and leaves the L{Deferred} with a result of
+        C{None}, as if a callback returning C{None} had been added to it.
+        """
+        d = defer.succeed(3)
+        def _yieldFired():
+            x = yield d
+            returnValue(x * 2)
+        _yieldFired = inlineCallbacks(_yieldFired)
+
+        result = _yieldFired()
+        result.addCallback(self.assertEqual, 6)
+        self.assertIdentical(d.result, None)
+        return result
+
 '''
 
 if sys.version_info > (2, 5):
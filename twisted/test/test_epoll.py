@@ -15,10 +15,15 @@ try:
 except ImportError:
     _epoll = None
 
+try:
+    from twisted.internet import epollreactor
+except ImportError:
+    epollreactor = None
 
-class EPoll(unittest.TestCase):
+
+class ConnectedPairMixin:
     """
-    Tests for the low-level epoll bindings.
+    Helpers for tests which need connected TCP sockets to poll.
     """
     def setUp(self):
         """
@@ -57,6 +62,11 @@ class EPoll(unittest.TestCase):
         return client, server
 
 
+
+class EPoll(ConnectedPairMixin, unittest.TestCase):
+    """
+    Tests for the low-level epoll bindings.
+    """
     def test_create(self):
         """
         Test the creation of an epoll object.
@@ -157,3 +167,47 @@ else:
     else:
         e.close()
         del e
+
+
+
+class SelectEPoll(ConnectedPairMixin, unittest.TestCase):
+    """
+    Tests for the wrapper which lets L{epollreactor} use L{select.epoll} in
+    place of the C{_epoll} extension module.
+    """
+    def test_controlAndWait(self):
+        """
+        Sockets added with C{_control} are reported by C{wait} with the
+        event mask the reactor expects.
+        """
+        client, server = self._connectedPair()
+
+        p = epollreactor._newPoller(16)
+        try:
+            p._control(epollreactor._CTL_ADD, client.fileno(),
+                       epollreactor._IN | epollreactor._OUT)
+            p._control(epollreactor._CTL_ADD, server.fileno(),
+                       epollreactor._IN)
+
+            events = untilConcludes(p.wait, 4, 1000)
+            self.assertEquals(events,
+                              [(client.fileno(), epollreactor._OUT)])
+
+            p._control(epollreactor._CTL_MOD, client.fileno(),
+                       epollreactor._IN)
+            client.send("Hello!")
+
+            events = untilConcludes(p.wait, 4, 1000)
+            self.assertEquals(events, [(server.fileno(), epollreactor._IN)])
+
+            p._control(epollreactor._CTL_DEL, server.fileno(), 0)
+            events = untilConcludes(p.wait, 4, 0)
+            self.failIf(events)
+        finally:
+            p.close()
+
+if epollreactor is None:
+    SelectEPoll.skip = "epollreactor cannot be imported"
+elif epollreactor._epoll is not None:
+    SelectEPoll.skip = (
+        "select.epoll unavailable; epollreactor uses the _epoll extension")
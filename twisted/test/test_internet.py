@@ -825,6 +825,34 @@ class TimeTestCase(unittest.TestCase):
             clock.uninstall()
 
 
+    def test_callLaterResetSooner(self):
+        """
+        A L{DelayedCall} which is reset to an earlier time more than once
+        runs once, at the last time it was reset to, and is reported only
+        once by C{getDelayedCalls} while it is pending.
+        """
+        clock = Clock()
+        clock.install()
+        try:
+            callbackTimes = []
+            call = reactor.callLater(10, lambda: callbackTimes.append(clock()))
+            clock.pump(reactor, [0, 1])
+
+            call.reset(5) # (now)1 + 5 = 6
+            call.reset(3) # (now)1 + 3 = 4
+            self.assertEquals(
+                [dc for dc in reactor.getDelayedCalls() if dc is call],
+                [call])
+
+            clock.pump(reactor, [0, 3])
+            self.assertEquals(callbackTimes, [4])
+
+            clock.pump(reactor, [0, 10])
+            self.assertEquals(callbackTimes, [4])
+        finally:
+            clock.uninstall()
+
+
     def testCallLaterTime(self):
         d = reactor.callLater(10, lambda: None)
         try:
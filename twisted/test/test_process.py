@@ -1284,6 +1284,13 @@ class MockOS(object):
         self.closed.append(fd)
 
 
+    def listdir(self, path):
+        """
+        Fake C{os.listdir}: always fail, as if C{/proc} was not mounted.
+        """
+        raise OSError(errno.ENOENT, path)
+
+
     def dup2(self, fd1, fd2):
         """
         Fake C{os.dup2}. Do nothing.
@@ -1502,6 +1509,33 @@ if process is not None:
 
 
 
+class ListOpenFDsTests(unittest.TestCase):
+    """
+    Tests for L{process._listOpenFDs}.
+    """
+    if process is None:
+        skip = "twisted.internet.process is never used on Windows"
+
+    def test_includesOpenDescriptor(self):
+        """
+        L{process._listOpenFDs} includes a descriptor opened by the process.
+        """
+        fd = os.open(os.devnull, os.O_RDONLY)
+        self.addCleanup(os.close, fd)
+        self.assertIn(fd, list(process._listOpenFDs()))
+
+
+    def test_procUnavailable(self):
+        """
+        If C{/proc/self/fd} cannot be listed, L{process._listOpenFDs} falls
+        back to every descriptor from 0 up to the process limit.
+        """
+        self.patch(process, "os", MockOS())
+        fds = list(process._listOpenFDs())
+        self.assertEqual(fds, range(len(fds)))
+
+
+
 class MockProcessTestCase(unittest.TestCase):
     """
     Mock a process runner to test forked child code path.
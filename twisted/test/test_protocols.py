@@ -6,6 +6,7 @@ Test cases for twisted.protocols package.
 """
 
 import struct
+from StringIO import StringIO
 
 from twisted.trial import unittest
 from twisted.protocols import basic, wire, portforward
@@ -778,3 +779,34 @@ class StringTransportTestCase(unittest.TestCase):
         """
         s = proto_helpers.StringTransport()
         self.assertRaises(TypeError, s.write, u'foo')
+
+
+
+class FileWrapperTestCase(unittest.TestCase):
+    """
+    Tests for L{protocol.FileWrapper}.
+    """
+
+    def test_writeSequence(self):
+        """
+        L{protocol.FileWrapper.writeSequence} writes each string of the
+        sequence to the wrapped file, in order.
+        """
+        f = StringIO()
+        transport = protocol.FileWrapper(f)
+        transport.writeSequence(["foo", "bar", "baz"])
+        self.assertEquals(f.getvalue(), "foobarbaz")
+
+
+    def test_writeSequenceError(self):
+        """
+        An error raised by the wrapped file while writing a sequence is
+        handled by L{protocol.FileWrapper.handleException}.
+        """
+        f = StringIO()
+        f.close()
+        transport = protocol.FileWrapper(f)
+        handled = []
+        transport.handleException = lambda: handled.append(True)
+        transport.writeSequence(["foo"])
+        self.assertEquals(handled, [True])
@@ -15,6 +15,7 @@ from twisted.python.log import msg
 from twisted.internet import protocol, reactor, defer, interfaces
 from twisted.internet import error
 from twisted.internet.address import IPv4Address
+from twisted.internet.posixbase import PosixReactorBase
 from twisted.internet.interfaces import IHalfCloseableProtocol, IPullProducer
 from twisted.protocols import policies
 
@@ -207,6 +208,27 @@ class ListeningTestCase(unittest.TestCase):
         return d
 
 
+    def test_listenMultiple(self):
+        """
+        Two ports created with C{listenMultiple=True} can listen on the same
+        TCP port at once.
+        """
+        f = MyServerFactory()
+        p1 = reactor.listenTCP(0, f, interface="127.0.0.1",
+                               listenMultiple=True)
+        self.addCleanup(p1.stopListening)
+        n = p1.getHost().port
+        p2 = reactor.listenTCP(n, f, interface="127.0.0.1",
+                               listenMultiple=True)
+        self.addCleanup(p2.stopListening)
+        self.assertEquals(p2.getHost().port, n)
+
+    if not hasattr(socket, "SO_REUSEPORT"):
+        test_listenMultiple.skip = "SO_REUSEPORT not available"
+    elif not isinstance(reactor, PosixReactorBase):
+        test_listenMultiple.skip = "listenMultiple not supported by reactor"
+
+
     def testNumberedInterface(self):
         f = MyServerFactory()
         # listen only on the loopback interface
@@ -930,6 +952,72 @@ class LocalRemoteAddressTestCase(unittest.TestCase):
         return onConnection
 
 
+    def test_hostAddressAfterConnectionLost(self):
+        """
+        L{ITCPTransport.getHost} keeps returning the local address of a
+        connection, on both the server and the client side, after the
+        connection has been lost.
+        """
+        serverFactory = MyServerFactory()
+        serverFactory.protocolConnectionLost = defer.Deferred()
+        serverConnectionLost = serverFactory.protocolConnectionLost
+        port = reactor.listenTCP(0, serverFactory, interface='127.0.0.1')
+        self.addCleanup(port.stopListening)
+        n = port.getHost().port
+
+        clientFactory = MyClientFactory()
+        onConnection = clientFactory.protocolConnectionMade = defer.Deferred()
+        connector = reactor.connectTCP('127.0.0.1', n, clientFactory)
+
+        def connected(clientProtocol):
+            hosts = (clientProtocol.transport.getHost(),
+                     serverFactory.protocol.transport.getHost())
+            connector.disconnect()
+            d = defer.gatherResults([serverConnectionLost,
+                                     clientFactory.deferred])
+            d.addCallback(lambda ignored: hosts)
+            return d
+        onConnection.addCallback(connected)
+
+        def disconnected((clientHost, serverHost)):
+            self.assertEquals(serverHost, port.getHost())
+            self.assertEquals(
+                clientFactory.protocol.transport.getHost(), clientHost)
+            self.assertEquals(
+                serverFactory.protocol.transport.getHost(), serverHost)
+        onConnection.addCallback(disconnected)
+        return onConnection
+
+
+    def test_serverPeerAddress(self):
+        """
+        The server side L{ITCPTransport.getPeer} returns the local address of
+        the client side of the connection, each time it is called.
+        """
+        serverFactory = MyServerFactory()
+        serverFactory.protocolConnectionLost = defer.Deferred()
+        serverConnectionLost = serverFactory.protocolConnectionLost
+        port = reactor.listenTCP(0, serverFactory, interface='127.0.0.1')
+        self.addCleanup(port.stopListening)
+        n = port.getHost().port
+
+        clientFactory = MyClientFactory()
+        onConnection = clientFactory.protocolConnectionMade = defer.Deferred()
+        connector = reactor.connectTCP('127.0.0.1', n, clientFactory)
+
+        def check(ignored):
+            serverTransport = serverFactory.protocol.transport
+            self.assertEquals(
+                serverTransport.getPeer(),
+                clientFactory.protocol.transport.getHost())
+            self.assertEquals(
+                serverTransport.getPeer(), serverTransport.getPeer())
+            connector.disconnect()
+            return serverConnectionLost
+        onConnection.addCallback(check)
+        return onConnection
+
+
 
 class WriterProtocol(protocol.Protocol):
     def connectionMade(self):
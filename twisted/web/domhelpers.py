@@ -174,7 +174,8 @@ def findNodes(parent, matcher, accum=None):
         # print child, child.nodeType, child.nodeName
         if matcher(child):
             accum.append(child)
-        findNodes(child, matcher, accum)
+        if child.hasChildNodes():
+            findNodes(child, matcher, accum)
     return accum
 
 